@@ -1,16 +1,42 @@
+import atexit
+import contextlib
+import copy
+import errno
+import functools
 import json
 import logging
 import os
+import queue
+import re
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 
 import requests
 import yt_dlp
-from PySide6.QtCore import QByteArray, QProcess, Qt, QThread, QTimer, Signal
+from yt_dlp.postprocessor import FFmpegExtractAudioPP
+from PySide6.QtCore import (
+    QByteArray,
+    QObject,
+    QProcess,
+    QRunnable,
+    QSortFilterProxyModel,
+    QStringListModel,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+)
 from PySide6.QtGui import QFont, QPalette, QTextCursor
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -27,7 +53,9 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
+    QProgressDialog,
     QPushButton,
     QScrollArea,
     QSpinBox,
@@ -38,22 +66,206 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+try:
+    import orjson  # Optional, faster settings (de)serialization
+except ImportError:
+    orjson = None
+
 # --- Setup Logging ---
 # Create a dedicated logs directory
 log_dir = os.path.join(os.getcwd(), "logs")
 os.makedirs(log_dir, exist_ok=True)
 log_file = os.path.join(log_dir, "debug_log.txt")
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(module)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_file, mode="w", encoding="utf-8"),
-        logging.StreamHandler(),  # Also print to console
-    ],
+log_formatter = logging.Formatter(
+    "%(asctime)s - %(levelname)s - %(module)s - %(message)s"
+)
+file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
+file_handler.setFormatter(log_formatter)
+stream_handler = logging.StreamHandler()  # Also print to console
+stream_handler.setFormatter(log_formatter)
+
+# Logging calls only enqueue records; a background listener thread does the
+# file and console I/O so worker threads don't serialize on handler locks
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, file_handler, stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.DEBUG)
+root_logger.addHandler(QueueHandler(log_queue))
+
+# Choices offered in the Global Settings panel
+LANGUAGES = (
+    "auto",
+    "af",
+    "am",
+    "ar",
+    "as",
+    "az",
+    "ba",
+    "be",
+    "bg",
+    "bn",
+    "bo",
+    "br",
+    "bs",
+    "ca",
+    "cs",
+    "cy",
+    "da",
+    "de",
+    "el",
+    "en",
+    "es",
+    "et",
+    "eu",
+    "fa",
+    "fi",
+    "fo",
+    "fr",
+    "gl",
+    "gu",
+    "ha",
+    "haw",
+    "he",
+    "hi",
+    "hr",
+    "ht",
+    "hu",
+    "hy",
+    "id",
+    "is",
+    "it",
+    "ja",
+    "jw",
+    "ka",
+    "kk",
+    "km",
+    "kn",
+    "ko",
+    "la",
+    "lb",
+    "ln",
+    "lo",
+    "lt",
+    "lv",
+    "mg",
+    "mi",
+    "mk",
+    "ml",
+    "mn",
+    "mr",
+    "ms",
+    "mt",
+    "my",
+    "ne",
+    "nl",
+    "nn",
+    "no",
+    "oc",
+    "pa",
+    "pl",
+    "ps",
+    "pt",
+    "ro",
+    "ru",
+    "sa",
+    "sd",
+    "si",
+    "sk",
+    "sl",
+    "sn",
+    "so",
+    "sq",
+    "sr",
+    "su",
+    "sv",
+    "sw",
+    "ta",
+    "te",
+    "tg",
+    "th",
+    "tk",
+    "tl",
+    "tr",
+    "tt",
+    "uk",
+    "ur",
+    "uz",
+    "vi",
+    "yi",
+    "yo",
+    "yue",
+    "zh",
+)
+COMPUTE_TYPES = (
+    "default",
+    "auto",
+    "int8",
+    "int8_float16",
+    "int8_float32",
+    "int8_bfloat16",
+    "int16",
+    "float16",
+    "float32",
+    "bfloat16",
+)
+OUTPUT_FORMATS = ("json", "vtt", "srt", "lrc", "txt", "tsv", "all")
+
+# Stylesheet file for each theme, keyed by lowercase theme name
+THEME_QSS = {
+    "light": "light_theme.qss",
+    "dark": "dark_theme.qss",
+    "amoled": "amoled_theme.qss",
+}
+
+# yt-dlp audio codecs (prefix before any ".profile" suffix) that Whisper's
+# ffmpeg front-end reads directly, so they are kept without re-encoding
+NATIVE_AUDIO_CODECS = ("mp3", "opus", "mp4a", "aac", "vorbis")
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Large downloads are split into this many parallel byte-range requests
+DOWNLOAD_SEGMENTS = 4
+SEGMENTED_DOWNLOAD_MIN_SIZE = 16 << 20  # 16 MiB
+# Minimum seconds between progress signals sent from worker threads
+PROGRESS_EMIT_INTERVAL = 0.05
+
+# Delay after the last UI change before settings are written to disk
+SETTINGS_SAVE_DELAY_MS = 500
+
+# Only ask GitHub for the latest yt-dlp release once a week
+YT_DLP_CHECK_INTERVAL = 7 * 24 * 60 * 60
+YT_DLP_LATEST_RELEASE_URL = "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
+
+# Process output is written to the console at most this often
+CONSOLE_FLUSH_INTERVAL_MS = 50
+CONSOLE_MAX_BLOCKS = 10000
+# Splits console output into alternating text and line-ending tokens
+CONSOLE_LINE_BREAK_RE = re.compile(r"([\r\n])")
+
+# Any of these in the process output means the transcription completed
+TRANSCRIPTION_SUCCESS_RE = re.compile(
+    "|".join(
+        re.escape(indicator)
+        for indicator in (
+            "Operation finished in:",
+            "Subtitles are written to",
+            "Transcription speed:",
+            "audio seconds/s",
+        )
+    )
 )
 
+# 7-Zip prints "NN%" progress tokens on stdout when run with -bsp1
+SEVENZIP_PERCENT_RE = re.compile(r"(\d{1,3})%")
+
+# Parsed settings files, keyed by path, with the (mtime, size) they were read at
+_settings_cache = {}
+
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -69,6 +281,109 @@ def resource_path(relative_path):
         return os.path.join(base_path, "resources", relative_path)
 
 
+@functools.lru_cache(maxsize=None)
+def console_font():
+    """Monospace console font, built once per process.
+
+    Created lazily because QFont needs a QGuiApplication to exist.
+    """
+    font = QFont("Courier New" if sys.platform == "win32" else "Monospace")
+    font.setPointSize(10)
+    font.setStyleHint(QFont.StyleHint.Monospace)
+    return font
+
+
+def read_settings_file(path):
+    """Load a settings file, reusing the last parse while the file is unchanged"""
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _settings_cache.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, "rb") as f:
+            raw = f.read()
+        cached = (key, orjson.loads(raw) if orjson else json.loads(raw))
+        _settings_cache[path] = cached
+    # Callers modify their settings, so never hand out the cached dictionary
+    return copy.deepcopy(cached[1])
+
+
+def find_7zip():
+    """Locate the 7-Zip executable, returning None if it isn't installed"""
+    sevenzip_executable = shutil.which("7z")
+    if not sevenzip_executable and sys.platform == "win32":
+        prog_files = os.environ.get("ProgramFiles", "C:\\Program Files")
+        prog_files_x86 = os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)")
+        possible_paths = [
+            os.path.join(prog_files, "7-Zip", "7z.exe"),
+            os.path.join(prog_files_x86, "7-Zip", "7z.exe"),
+        ]
+        for path in possible_paths:
+            if os.path.exists(path):
+                sevenzip_executable = path
+                break
+    return sevenzip_executable
+
+
+def preallocate_file(f, size):
+    """Reserve size bytes for an open file up front so it is laid out in one go"""
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # Filesystem doesn't support it, fall back to extending
+    f.truncate(size)
+
+
+def copy_file(source_path, dest_path):
+    """Copy a file inside the kernel where possible, keeping its permission bits"""
+    try:
+        if not hasattr(os, "copy_file_range"):
+            raise OSError("copy_file_range is not available")
+        with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+            while os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30):
+                pass
+    except OSError:
+        # shutil.copyfile still uses sendfile() where the platform has it
+        shutil.copyfile(source_path, dest_path)
+    shutil.copystat(source_path, dest_path)
+    return dest_path
+
+
+def replace_path(source_path, dest_path):
+    """Move a file or directory to dest_path, replacing anything already there"""
+    logging.info(f"Moving '{source_path}' to '{dest_path}'")
+    if os.path.isdir(dest_path):
+        shutil.rmtree(dest_path)
+    elif os.path.exists(dest_path):
+        os.remove(dest_path)
+
+    try:
+        os.rename(source_path, dest_path)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    if os.path.isdir(source_path):
+        shutil.copytree(source_path, dest_path, copy_function=copy_file)
+        shutil.rmtree(source_path)
+    else:
+        copy_file(source_path, dest_path)
+        os.unlink(source_path)
+
+
+class Worker(QRunnable):
+    """Run a callable on a QThreadPool thread"""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+
+    def run(self):
+        self.fn()
+
+
 class YouTubeDownloader(QThread):
     finished = Signal(str)
     error = Signal(str)
@@ -101,13 +416,6 @@ class YouTubeDownloader(QThread):
             if self.audio_only:
                 ydl_opts = {
                     "format": "bestaudio/best",
-                    "postprocessors": [
-                        {
-                            "key": "FFmpegExtractAudio",
-                            "preferredcodec": "mp3",
-                            "preferredquality": "192",
-                        }
-                    ],
                     "outtmpl": output_template,
                     "noplaylist": True,
                     "progress_hooks": [self.progress_hook],
@@ -123,10 +431,23 @@ class YouTubeDownloader(QThread):
                 }
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info_dict = ydl.extract_info(self.url, download=True)
+                info_dict = ydl.extract_info(self.url, download=False)
+
+                # Whisper decodes common audio codecs itself, so only pay for
+                # an MP3 re-encode when the selected stream needs it
+                acodec = (info_dict.get("acodec") or "").split(".")[0]
+                needs_transcode = self.audio_only and acodec not in NATIVE_AUDIO_CODECS
+                if needs_transcode:
+                    ydl.add_post_processor(
+                        FFmpegExtractAudioPP(
+                            ydl, preferredcodec="mp3", preferredquality="192"
+                        )
+                    )
+
+                info_dict = ydl.process_ie_result(info_dict, download=True)
                 final_filename = ydl.prepare_filename(info_dict)
 
-                if self.audio_only:
+                if needs_transcode:
                     base, _ = os.path.splitext(final_filename)
                     final_filename = base + ".mp3"
 
@@ -136,6 +457,15 @@ class YouTubeDownloader(QThread):
                     )
 
                 self.finished.emit(final_filename)
+        except yt_dlp.utils.DownloadError as e:
+            error_text = str(e)
+            # yt-dlp errors are self-explanatory, and a cancel raised from
+            # progress_hook is expected, so skip the traceback for both
+            if self.stop_requested:
+                logging.info("yt-dlp download cancelled by user.")
+            else:
+                logging.error(f"yt-dlp download error: {error_text}")
+            self.error.emit(error_text)
         except Exception as e:
             logging.error(f"yt-dlp thread error: {e}", exc_info=True)
             self.error.emit(str(e))
@@ -158,8 +488,13 @@ class DownloadManager(QDialog):
         self.destination_dir = destination_dir
         self.error_string = None
         self.archive_path = "whisper_essentials.7z"
-        self.worker_thread = None
+        self.sevenzip_executable = None
+        self.thread_pool = QThreadPool.globalInstance()
         self.cancelled = False
+        self.progress_lock = threading.Lock()
+        self.downloaded_size = 0
+        self.segment_failed = False
+        self.last_progress_emit = 0.0
 
         self.setWindowTitle("Setup Progress")
         self.setModal(True)
@@ -175,8 +510,14 @@ class DownloadManager(QDialog):
         layout.addWidget(self.cancel_button)
 
         self.cancel_button.clicked.connect(self.cancel)
-        self.download_progress.connect(self.update_download_progress)
-        self.extraction_progress.connect(self.update_extraction_progress)
+        # Progress is emitted from worker threads; queue it explicitly so the
+        # GUI thread only ever handles it from its own event loop
+        self.download_progress.connect(
+            self.update_download_progress, Qt.ConnectionType.QueuedConnection
+        )
+        self.extraction_progress.connect(
+            self.update_extraction_progress, Qt.ConnectionType.QueuedConnection
+        )
         self.error_occurred.connect(self.on_error)
         self.download_finished_signal.connect(self.start_extraction)
         self.extraction_finished_signal.connect(self.on_extraction_finished)
@@ -184,33 +525,155 @@ class DownloadManager(QDialog):
         QTimer.singleShot(100, self.start_download)
 
     def start_download(self):
+        # The .7z format can't be extracted from a stream, so extraction has
+        # to wait for the download. Check for 7-Zip now rather than after
+        # downloading ~1.4 GB.
+        self.sevenzip_executable = find_7zip()
+        if not self.sevenzip_executable:
+            self.error_occurred.emit(
+                "7-Zip/p7zip executable not found. Please install it and ensure it's in your system's PATH. "
+                "On Windows, install from 7-zip.org. On Linux, use e.g., 'sudo apt install p7zip-full'."
+            )
+            return
+
         self.details_label.setText("Starting download...")
-        self.worker_thread = threading.Thread(target=self.download_worker, daemon=True)
-        self.worker_thread.start()
+        self.thread_pool.start(Worker(self.download_worker))
 
     def download_worker(self):
         try:
-            response = requests.get(self.url, stream=True, timeout=15)
-            response.raise_for_status()
-            total_size = int(response.headers.get("content-length", 0))
+            total_size, accepts_ranges = self.probe_download()
+            if accepts_ranges and total_size >= SEGMENTED_DOWNLOAD_MIN_SIZE:
+                self.download_segmented(total_size)
+            else:
+                self.download_stream()
+
+            if self.cancelled:
+                self.cleanup_archive()
+                return
+            self.download_finished_signal.emit()
+        except requests.RequestException as e:
+            error_text = f"{type(e).__name__}: {e}"
+            logging.error(f"Setup download failed: {error_text}")
+            self.error_occurred.emit(f"Download failed: {error_text}")
+        except Exception as e:
+            logging.error(f"Setup download failed: {e}", exc_info=True)
+            self.error_occurred.emit(f"Download failed: {e}")
 
-            downloaded_size = 0
-            with open(self.archive_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self.cancelled:
-                        self.cleanup_archive()
+    def probe_download(self):
+        """Return the archive size and whether the server serves byte ranges"""
+        try:
+            response = requests.head(self.url, allow_redirects=True, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logging.warning(f"HEAD request failed, using a single connection: {e}")
+            return 0, False
+        total_size = int(response.headers.get("content-length", 0))
+        accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+        return total_size, accepts_ranges
+
+    def download_stream(self):
+        """Download the archive over a single connection"""
+        response = requests.get(self.url, stream=True, timeout=15)
+        response.raise_for_status()
+        total_size = int(response.headers.get("content-length", 0))
+
+        raw = response.raw
+        raw.decode_content = True
+
+        # Reuse one buffer for the whole download instead of a new bytes
+        # object per chunk
+        buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+        downloaded_size = 0
+        with open(self.archive_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            if total_size:
+                preallocate_file(f, total_size)
+            while n := raw.readinto(view):
+                if self.cancelled:
+                    return
+                f.write(view[:n])
+                downloaded_size += n
+                self.report_download_progress(downloaded_size, total_size)
+            # Drop any reserved space the response didn't fill
+            f.truncate()
+
+        self.report_download_progress(downloaded_size, total_size, force=True)
+
+    def download_segmented(self, total_size):
+        """Download the archive as parallel byte ranges written at their offsets"""
+        with open(self.archive_path, "wb") as f:
+            preallocate_file(f, total_size)
+
+        segment_size = -(-total_size // DOWNLOAD_SEGMENTS)
+        ranges = [
+            (start, min(start + segment_size, total_size) - 1)
+            for start in range(0, total_size, segment_size)
+        ]
+        logging.info(f"Downloading {total_size} bytes in {len(ranges)} segments")
+
+        self.downloaded_size = 0
+        self.segment_failed = False
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(self.fetch_range, start, end, total_size)
+                for start, end in ranges
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                # Stop the remaining segments instead of waiting them out
+                self.segment_failed = True
+                raise
+
+        self.report_download_progress(self.downloaded_size, total_size, force=True)
+
+    def fetch_range(self, start, end, total_size):
+        headers = {"Range": f"bytes={start}-{end}"}
+        with requests.get(
+            self.url, headers=headers, stream=True, timeout=15
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise RuntimeError("Server ignored the byte range request.")
+
+            raw = response.raw
+            raw.decode_content = True
+            view = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+            written = 0
+            with open(self.archive_path, "r+b", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                f.seek(start)
+                while n := raw.readinto(view):
+                    if self.cancelled or self.segment_failed:
                         return
-                    f.write(chunk)
-                    downloaded_size += len(chunk)
-                    status_text = f"{downloaded_size / (1024 * 1024):.2f} MB / {total_size / (1024 * 1024):.2f} MB"
-                    self.download_progress.emit(
-                        downloaded_size, total_size, status_text
-                    )
+                    f.write(view[:n])
+                    written += n
+                    with self.progress_lock:
+                        self.downloaded_size += n
+                        downloaded_size = self.downloaded_size
+                    self.report_download_progress(downloaded_size, total_size)
+
+        if written != end - start + 1:
+            raise RuntimeError(
+                f"Segment {start}-{end} ended early after {written} bytes."
+            )
 
-            if not self.cancelled:
-                self.download_finished_signal.emit()
-        except Exception as e:
-            self.error_occurred.emit(f"Download failed: {e}")
+    def report_download_progress(self, downloaded_size, total_size, force=False):
+        """Emit download progress, rate-limited across all download threads"""
+        with self.progress_lock:
+            now = time.monotonic()
+            if not force and now - self.last_progress_emit < PROGRESS_EMIT_INTERVAL:
+                return
+            self.last_progress_emit = now
+        self.download_progress.emit(
+            downloaded_size,
+            total_size,
+            self.format_download_status(downloaded_size, total_size),
+        )
+
+    @staticmethod
+    def format_download_status(downloaded_size, total_size):
+        return f"{downloaded_size / (1024 * 1024):.2f} MB / {total_size / (1024 * 1024):.2f} MB"
 
     def update_download_progress(self, value, total, text):
         if self.progress_bar.maximum() != total:
@@ -222,14 +685,15 @@ class DownloadManager(QDialog):
         self.status_label.setText("Extracting files...")
         self.progress_bar.setValue(0)
         self.details_label.setText("Preparing to extract...")
-        self.worker_thread = threading.Thread(
-            target=self.extraction_worker, daemon=True
-        )
-        self.worker_thread.start()
+        self.thread_pool.start(Worker(self.extraction_worker))
 
     def extraction_worker(self):
-        # Use secure temporary directory instead of hardcoded name
-        extract_dir = tempfile.mkdtemp(prefix="whisper_extract_")
+        # Use secure temporary directory instead of hardcoded name. It lives
+        # next to the destination so the final moves are same-filesystem renames.
+        extract_dir = tempfile.mkdtemp(
+            prefix=".whisper_extract_",
+            dir=os.path.dirname(os.path.abspath(self.destination_dir)),
+        )
         try:
             logging.info("--- Starting Extraction ---")
             if os.path.exists(extract_dir):
@@ -238,27 +702,7 @@ class DownloadManager(QDialog):
             os.makedirs(extract_dir, exist_ok=True)
             logging.info(f"Created temp directory: {extract_dir}")
 
-            sevenzip_executable = shutil.which("7z")
-            if not sevenzip_executable and sys.platform == "win32":
-                prog_files = os.environ.get("ProgramFiles", "C:\\Program Files")
-                prog_files_x86 = os.environ.get(
-                    "ProgramFiles(x86)", "C:\\Program Files (x86)"
-                )
-                possible_paths = [
-                    os.path.join(prog_files, "7-Zip", "7z.exe"),
-                    os.path.join(prog_files_x86, "7-Zip", "7z.exe"),
-                ]
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        sevenzip_executable = path
-                        break
-            if not sevenzip_executable:
-                error_msg = (
-                    "7-Zip/p7zip executable not found. Please install it and ensure it's in your system's PATH. "
-                    "On Windows, install from 7-zip.org. On Linux, use e.g., 'sudo apt install p7zip-full'."
-                )
-                raise FileNotFoundError(error_msg)
-
+            sevenzip_executable = self.sevenzip_executable
             logging.info(f"Using 7-Zip executable: {sevenzip_executable}")
             self.extraction_progress.emit(
                 0, 0, "Extracting archive using 7-Zip... (This may take a moment)"
@@ -269,22 +713,18 @@ class DownloadManager(QDialog):
                 self.archive_path,
                 f"-o{extract_dir}",
                 "-y",
+                f"-mmt={os.cpu_count() or 4}",
+                "-bsp1",
             ]
             logging.info(f"Executing command: {' '.join(command)}")
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-            )
-            if result.returncode != 0:
+            exit_code, error_output = self.run_7zip(command)
+            if self.cancelled:
+                return
+            if exit_code != 0:
                 logging.error(
-                    f"7-Zip failed with code {result.returncode}\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-                )
-                raise RuntimeError(
-                    f"7-Zip extraction failed. Error: {result.stderr or result.stdout}"
+                    f"7-Zip failed with code {exit_code}\nOUTPUT: {error_output}"
                 )
+                raise RuntimeError(f"7-Zip extraction failed. Error: {error_output}")
             logging.info("Extraction complete.")
 
             self.extraction_progress.emit(1, 2, "Finalizing installation...")
@@ -313,24 +753,38 @@ class DownloadManager(QDialog):
                 f"Ensured destination directory exists: {self.destination_dir}"
             )
 
-            for item_name in os.listdir(source_dir):
-                source_path = os.path.join(source_dir, item_name)
-                dest_path = os.path.join(self.destination_dir, item_name)
-                logging.info(f"Moving '{source_path}' to '{dest_path}'")
-
-                if os.path.isdir(dest_path):
-                    shutil.rmtree(dest_path)
-                elif os.path.exists(dest_path):
-                    os.remove(dest_path)
-
-                shutil.move(source_path, dest_path)
+            moves = [
+                (
+                    os.path.join(source_dir, item_name),
+                    os.path.join(self.destination_dir, item_name),
+                )
+                for item_name in os.listdir(source_dir)
+            ]
+            # Moves are plain renames on the same filesystem, but fall back to
+            # copies otherwise, so run them concurrently
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+                futures = [
+                    pool.submit(replace_path, source_path, dest_path)
+                    for source_path, dest_path in moves
+                ]
+                for done, future in enumerate(as_completed(futures), start=1):
+                    future.result()
+                    self.extraction_progress.emit(
+                        done,
+                        len(futures),
+                        f"Finalizing installation... ({done}/{len(futures)})",
+                    )
 
             self.extraction_progress.emit(2, 2, "Verifying files...")
             logging.info("Verifying extracted files...")
 
             for filename in self.files_to_extract:
                 final_path = os.path.join(self.destination_dir, filename)
-                if not os.path.exists(final_path) or os.path.getsize(final_path) == 0:
+                try:
+                    is_valid = os.stat(final_path).st_size > 0
+                except FileNotFoundError:
+                    is_valid = False
+                if not is_valid:
                     raise FileNotFoundError(
                         f"Verification failed: '{filename}' is missing or empty in '{self.destination_dir}' after extraction."
                     )
@@ -347,8 +801,55 @@ class DownloadManager(QDialog):
             logging.error(f"--- Extraction Failed ---\n{error_details}")
             self.error_occurred.emit(f"Extraction process failed: {e}")
         finally:
+            # The temp dir sits next to the install, never leave it behind,
+            # even when extraction was cancelled or failed
+            shutil.rmtree(extract_dir, ignore_errors=True)
             if not self.error_string:
-                self.cleanup_archive_and_dir(extract_dir)
+                self.cleanup_archive()
+
+    def run_7zip(self, command):
+        """Run 7-Zip and stream its -bsp1 percentages to the progress bar"""
+        process = QProcess()
+        process.start(command[0], command[1:])
+        if not process.waitForStarted():
+            raise RuntimeError(f"Failed to start 7-Zip: {process.errorString()}")
+
+        last_percent = -1
+        output_tail = ""
+        error_tail = ""
+        while True:
+            running = process.state() != QProcess.ProcessState.NotRunning
+            if running:
+                if self.cancelled:
+                    process.kill()
+                    process.waitForFinished()
+                    return -1, "Cancelled by user."
+                process.waitForReadyRead(200)
+
+            output = (
+                process.readAllStandardOutput().data().decode("utf-8", errors="replace")
+            )
+            error = (
+                process.readAllStandardError().data().decode("utf-8", errors="replace")
+            )
+            # Only keep the tail around for error reporting
+            output_tail = (output_tail + output)[-4096:]
+            error_tail = (error_tail + error)[-4096:]
+
+            if matches := SEVENZIP_PERCENT_RE.findall(output):
+                percent = int(matches[-1])
+                if percent > last_percent:
+                    last_percent = percent
+                    self.extraction_progress.emit(
+                        percent, 100, f"Extracting archive using 7-Zip... {percent}%"
+                    )
+
+            if not running:
+                break
+
+        if process.exitStatus() == QProcess.ExitStatus.CrashExit:
+            return -1, error_tail or output_tail or "7-Zip crashed."
+        return process.exitCode(), (error_tail or output_tail).strip()
 
     def cleanup_archive_and_dir(self, dir_path):
         self.cleanup_archive()
@@ -376,6 +877,8 @@ class DownloadManager(QDialog):
             self.status_label.setText("Cancelling...")
             self.cancel_button.setEnabled(False)
             self.error_string = "User cancelled."
+            # Drop any work that has not started yet
+            self.thread_pool.clear()
             self.reject()
 
     def cleanup_archive(self):
@@ -387,15 +890,86 @@ class DownloadManager(QDialog):
         super().reject()
 
 
+class SettingsWriter(QObject):
+    """Writes settings snapshots to disk, meant to live on a worker thread"""
+
+    def __init__(self, settings_file):
+        super().__init__()
+        self.settings_file = settings_file
+        # Contents of the last successful write, to skip rewriting the same data
+        self.last_written = None
+        # At shutdown the GUI thread writes directly, possibly while the worker
+        # thread is still finishing an older snapshot; keep them in order
+        self._lock = threading.Lock()
+
+    def write(self, settings):
+        """Save a settings dictionary to file atomically"""
+        with self._lock:
+            self._write(settings)
+
+    def _write(self, settings):
+        temp_file = None
+        try:
+            if orjson:
+                data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+            else:
+                # Only the app reads this file, so skip indenting it
+                data = json.dumps(settings, separators=(",", ":")).encode("utf-8")
+            if data == self.last_written:
+                return
+            # Write to a temporary file next to the settings file, then swap
+            # it in so a crash never leaves a truncated settings file behind
+            with tempfile.NamedTemporaryFile(
+                "wb",
+                dir=os.path.dirname(os.path.abspath(self.settings_file)),
+                prefix=".settings_",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                temp_file = f.name
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.settings_file)
+            _settings_cache.pop(self.settings_file, None)
+            self.last_written = data
+        except Exception as e:
+            logging.error(f"Failed to save settings: {e}")
+            # Clean up the temp file without probing for it first
+            if temp_file:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_file)
+
+
 class WhisperGUI(QMainWindow):
+    settings_write_requested = Signal(object)
+
     def __init__(self):
         super().__init__()
         self.process = None
         self.downloader = None
+        self.update_process = None
         self.stop_requested = False
         self.output_format_checkboxes = {}
+        self._qss_cache = {}
+        self._network_manager = QNetworkAccessManager(self)
+        self._current_theme = None
         self.settings_file = "settings.json"
         self.settings = {}
+        # Settings are serialized and written on a dedicated thread
+        self._settings_writer = SettingsWriter(self.settings_file)
+        self._settings_writer_thread = QThread(self)
+        self._settings_writer.moveToThread(self._settings_writer_thread)
+        # Only hand snapshots to the thread while its event loop is running
+        self._settings_writer_active = False
+        self.settings_write_requested.connect(
+            self._settings_writer.write, Qt.ConnectionType.QueuedConnection
+        )
+        # Coalesce bursts of UI changes into a single settings write
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self.save_settings_to_file)
 
         self.executable_path = None
         self.executable_name = None
@@ -410,10 +984,21 @@ class WhisperGUI(QMainWindow):
         if not self.check_and_setup_dependencies():
             QTimer.singleShot(0, self.close)
             return
+        # The executable doesn't move during a session, so check it once
+        self._executable_error = self.check_executable()
 
         self.init_ui()
+        # Checkboxes persisted by object name, collected once the UI exists
+        self._named_checkboxes = {
+            cb.objectName(): cb
+            for cb in self.findChildren(QCheckBox)
+            if cb.objectName()
+        }
+        self.setup_command_options()
         self.load_settings()
         self.setup_realtime_saving()
+        self._settings_writer_thread.start()
+        self._settings_writer_active = True
 
         # Check yt-dlp version after UI is ready
         QTimer.singleShot(1000, self.check_yt_dlp_version)
@@ -434,9 +1019,13 @@ class WhisperGUI(QMainWindow):
             return False
 
         local_executable_path = os.path.join(self.bin_dir, self.executable_name)
-        all_files_in_bin = all(
-            os.path.exists(os.path.join(self.bin_dir, f)) for f in self.files_to_check
-        )
+        # One directory read instead of a stat() per required file
+        try:
+            with os.scandir(self.bin_dir) as entries:
+                bin_names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            bin_names = set()
+        all_files_in_bin = bin_names.issuperset(self.files_to_check)
 
         if all_files_in_bin:
             self.executable_path = os.path.abspath(local_executable_path)
@@ -584,7 +1173,7 @@ class WhisperGUI(QMainWindow):
         self.audio_only_checkbox = QCheckBox("Audio-only (Recommended)")
         self.audio_only_checkbox.setObjectName("audio_only_checkbox")
         self.audio_only_checkbox.setToolTip(
-            "If checked, only downloads the audio as MP3. Uncheck to download the full video."
+            "If checked, only downloads the audio (converted to MP3 only when needed). Uncheck to download the full video."
         )
         self.audio_only_checkbox.setChecked(True)
         layout.addRow(self.audio_only_checkbox)
@@ -608,130 +1197,25 @@ class WhisperGUI(QMainWindow):
         self.task_combo.addItems(["transcribe", "translate"])
         layout.addRow("Task:", self.task_combo)
         self.language_combo = QComboBox()
-        languages = ["auto"] + [
-            "af",
-            "am",
-            "ar",
-            "as",
-            "az",
-            "ba",
-            "be",
-            "bg",
-            "bn",
-            "bo",
-            "br",
-            "bs",
-            "ca",
-            "cs",
-            "cy",
-            "da",
-            "de",
-            "el",
-            "en",
-            "es",
-            "et",
-            "eu",
-            "fa",
-            "fi",
-            "fo",
-            "fr",
-            "gl",
-            "gu",
-            "ha",
-            "haw",
-            "he",
-            "hi",
-            "hr",
-            "ht",
-            "hu",
-            "hy",
-            "id",
-            "is",
-            "it",
-            "ja",
-            "jw",
-            "ka",
-            "kk",
-            "km",
-            "kn",
-            "ko",
-            "la",
-            "lb",
-            "ln",
-            "lo",
-            "lt",
-            "lv",
-            "mg",
-            "mi",
-            "mk",
-            "ml",
-            "mn",
-            "mr",
-            "ms",
-            "mt",
-            "my",
-            "ne",
-            "nl",
-            "nn",
-            "no",
-            "oc",
-            "pa",
-            "pl",
-            "ps",
-            "pt",
-            "ro",
-            "ru",
-            "sa",
-            "sd",
-            "si",
-            "sk",
-            "sl",
-            "sn",
-            "so",
-            "sq",
-            "sr",
-            "su",
-            "sv",
-            "sw",
-            "ta",
-            "te",
-            "tg",
-            "th",
-            "tk",
-            "tl",
-            "tr",
-            "tt",
-            "uk",
-            "ur",
-            "uz",
-            "vi",
-            "yi",
-            "yo",
-            "yue",
-            "zh",
-        ]
-        self.language_combo.addItems(languages)
+        self.language_model = QStringListModel(list(LANGUAGES), self.language_combo)
+        self.language_combo.setModel(self.language_model)
         self.language_combo.setEditable(True)
         self.language_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
-        # Safe completer access with null check
-        if completer := self.language_combo.completer():
-            completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        # Complete against a sorted view of the languages so QCompleter can
+        # binary-search prefixes instead of scanning every entry per keystroke
+        sorted_languages = QSortFilterProxyModel(self.language_combo)
+        sorted_languages.setSourceModel(self.language_model)
+        sorted_languages.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        sorted_languages.sort(0)
+        completer = QCompleter(sorted_languages, self.language_combo)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        completer.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.language_combo.setCompleter(completer)
         layout.addRow("Language:", self.language_combo)
         self.compute_combo = QComboBox()
-        self.compute_combo.addItems(
-            [
-                "default",
-                "auto",
-                "int8",
-                "int8_float16",
-                "int8_float32",
-                "int8_bfloat16",
-                "int16",
-                "float16",
-                "float32",
-                "bfloat16",
-            ]
-        )
+        self.compute_combo.addItems(COMPUTE_TYPES)
         layout.addRow("Compute Type:", self.compute_combo)
         self.device_combo = QComboBox()
         self.device_combo.addItems(["cuda", "cpu"])
@@ -742,9 +1226,8 @@ class WhisperGUI(QMainWindow):
         grid_layout = QGridLayout()
         grid_layout.setHorizontalSpacing(40)
         grid_layout.setVerticalSpacing(10)
-        formats = ["json", "vtt", "srt", "lrc", "txt", "tsv", "all"]
         num_rows = 4
-        for i, fmt in enumerate(formats):
+        for i, fmt in enumerate(OUTPUT_FORMATS):
             checkbox = QCheckBox(fmt)
             checkbox.setObjectName(f"format_checkbox_{fmt}")
             self.output_format_checkboxes[fmt] = checkbox
@@ -761,12 +1244,21 @@ class WhisperGUI(QMainWindow):
     def create_output_console(self):
         output_group = QGroupBox("Console Output")
         layout = QVBoxLayout(output_group)
-        self.output_text = QTextEdit()
+        # Plain text widget, the console never needs rich text layout
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
-        font = QFont("Courier New" if sys.platform == "win32" else "Monospace")
-        font.setPointSize(10)
-        self.output_text.setFont(font)
+        self.output_text.setFont(console_font())
+        # Drop the oldest lines so long sessions don't grow without bound
+        self.output_text.setMaximumBlockCount(CONSOLE_MAX_BLOCKS)
+        # Reused for every append instead of copying the widget's cursor
+        self._append_cursor = QTextCursor(self.output_text.document())
         layout.addWidget(self.output_text)
+
+        self._pending_output = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(CONSOLE_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_console)
         return output_group
 
     def create_button_layout(self):
@@ -891,39 +1383,37 @@ class WhisperGUI(QMainWindow):
         layout.addRow("Tempo:", tempo_layout)
 
     def apply_theme(self, theme_name):
-        self.settings["theme"] = theme_name.lower()
-        qss_path = ""
-        if theme_name.lower() == "light":
-            qss_path = resource_path("light_theme.qss")
-        elif theme_name.lower() == "dark":
-            qss_path = resource_path("dark_theme.qss")
-        elif theme_name.lower() == "amoled":
-            qss_path = resource_path("amoled_theme.qss")
-
-        if qss_path and os.path.exists(qss_path):
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
-        else:
-            self.setStyleSheet("")
-            if qss_path:
-                logging.warning(f"Theme file not found: {qss_path}")
+        theme = theme_name.lower()
+        # Re-applying the same stylesheet would only make Qt re-parse it
+        if theme == self._current_theme:
+            return
+        self._current_theme = theme
+        self.settings["theme"] = theme
 
-        # Save theme change immediately
-        self.save_settings_to_file()
+        qss_file = THEME_QSS.get(theme)
+        qss_path = resource_path(qss_file) if qss_file else ""
+        self.setStyleSheet(self.load_stylesheet(qss_path))
+
+        self.schedule_settings_save()
+
+    def load_stylesheet(self, qss_path):
+        """Read a theme's QSS file once and serve it from memory afterwards"""
+        if qss_path not in self._qss_cache:
+            if qss_path and os.path.exists(qss_path):
+                with open(qss_path, "r") as f:
+                    self._qss_cache[qss_path] = f.read()
+            else:
+                if qss_path:
+                    logging.warning(f"Theme file not found: {qss_path}")
+                self._qss_cache[qss_path] = ""
+        return self._qss_cache[qss_path]
 
     def check_for_transcription_success(self, text):
         """Check if the output indicates successful transcription completion"""
-        success_indicators = [
-            "Operation finished in:",
-            "Subtitles are written to",
-            "Transcription speed:",
-            "audio seconds/s",
-        ]
-
-        for indicator in success_indicators:
-            if indicator in text:
-                self.transcription_completed_successfully = True
-                break
+        if self.transcription_completed_successfully:
+            return
+        if TRANSCRIPTION_SUCCESS_RE.search(text):
+            self.transcription_completed_successfully = True
 
     def get_system_theme(self):
         """Detect system theme preference"""
@@ -941,7 +1431,20 @@ class WhisperGUI(QMainWindow):
             return "dark"  # Default fallback
 
     def check_yt_dlp_version(self):
+        """Ask GitHub for the latest yt-dlp release without blocking the UI"""
+        last_check = self.settings.get("yt_dlp_last_check", 0)
+        if time.time() - last_check < YT_DLP_CHECK_INTERVAL:
+            logging.info("Skipping yt-dlp update check, last check was recent")
+            return
+
+        request = QNetworkRequest(QUrl(YT_DLP_LATEST_RELEASE_URL))
+        request.setTransferTimeout(5000)
+        reply = self._network_manager.get(request)
+        reply.finished.connect(functools.partial(self.on_yt_dlp_release_reply, reply))
+
+    def on_yt_dlp_release_reply(self, reply):
         """Check if yt-dlp needs updating and prompt user"""
+        reply.deleteLater()
         try:
             import yt_dlp
 
@@ -949,37 +1452,39 @@ class WhisperGUI(QMainWindow):
             current_version = yt_dlp.version.__version__
             logging.info(f"Current yt-dlp version: {current_version}")
 
-            # Check for latest version (with timeout to avoid blocking)
-            try:
-                response = requests.get(
-                    "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest",
-                    timeout=5,
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                logging.warning(
+                    f"Failed to check yt-dlp version: {reply.errorString()}"
                 )
-                if response.status_code == 200:
-                    latest_data = response.json()
-                    latest_version = latest_data["tag_name"]
-
-                    if current_version != latest_version:
-                        reply = QMessageBox.question(
-                            self,
-                            "yt-dlp Update Available",
-                            f"Your yt-dlp version ({current_version}) is outdated.\n"
-                            f"Latest version is {latest_version}.\n\n"
-                            "Would you like to update it now?\n"
-                            "(This may fix 403 unauthorized errors for video downloads)",
-                            QMessageBox.StandardButton.Yes
-                            | QMessageBox.StandardButton.No,
-                            QMessageBox.StandardButton.Yes,
-                        )
+                return
+            status_code = reply.attribute(
+                QNetworkRequest.Attribute.HttpStatusCodeAttribute
+            )
+            if status_code != 200:
+                logging.warning("Could not check for yt-dlp updates")
+                return
 
-                        if reply == QMessageBox.StandardButton.Yes:
-                            self.update_yt_dlp()
-                    else:
-                        logging.info("yt-dlp is up to date")
-                else:
-                    logging.warning("Could not check for yt-dlp updates")
-            except requests.RequestException as e:
-                logging.warning(f"Failed to check yt-dlp version: {e}")
+            latest_data = json.loads(reply.readAll().data())
+            latest_version = latest_data["tag_name"]
+            self.settings["yt_dlp_last_check"] = time.time()
+            self.schedule_settings_save()
+
+            if current_version != latest_version:
+                answer = QMessageBox.question(
+                    self,
+                    "yt-dlp Update Available",
+                    f"Your yt-dlp version ({current_version}) is outdated.\n"
+                    f"Latest version is {latest_version}.\n\n"
+                    "Would you like to update it now?\n"
+                    "(This may fix 403 unauthorized errors for video downloads)",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.Yes,
+                )
+
+                if answer == QMessageBox.StandardButton.Yes:
+                    self.update_yt_dlp()
+            else:
+                logging.info("yt-dlp is up to date")
 
         except ImportError:
             logging.error("yt-dlp not found")
@@ -987,89 +1492,160 @@ class WhisperGUI(QMainWindow):
             logging.error(f"Error checking yt-dlp version: {e}")
 
     def update_yt_dlp(self):
-        """Update yt-dlp using pip"""
-        try:
-            # Show progress dialog
-            progress = QMessageBox(self)
-            progress.setWindowTitle("Updating yt-dlp")
-            progress.setText("Updating yt-dlp, please wait...")
-            progress.setStandardButtons(QMessageBox.StandardButton.NoButton)
-            progress.show()
-
-            # Process events to show the dialog
-            from PySide6.QtCore import QCoreApplication
-
-            QCoreApplication.processEvents()
-
-            # Update yt-dlp
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "--upgrade", "yt-dlp"],
-                capture_output=True,
-                text=True,
-                timeout=60,
+        """Update yt-dlp using pip without blocking the UI"""
+        # pip output shares the console with downloads and transcriptions,
+        # so only one of them may run at a time
+        if (
+            self.process and self.process.state() != QProcess.ProcessState.NotRunning
+        ) or (self.downloader and self.downloader.isRunning()):
+            QMessageBox.information(
+                self,
+                "Update yt-dlp",
+                "Please wait for the current job to finish before updating yt-dlp.",
             )
+            return
 
-            progress.close()
+        if self.update_process is None:
+            self.update_process = QProcess(self)
+            self.update_process.setProcessChannelMode(
+                QProcess.ProcessChannelMode.MergedChannels
+            )
+            self.update_process.readyReadStandardOutput.connect(
+                self.handle_update_output
+            )
+            self.update_process.finished.connect(self.on_update_finished)
+            self.update_process.errorOccurred.connect(self.on_update_error)
 
-            if result.returncode == 0:
-                QMessageBox.information(
-                    self,
-                    "Update Successful",
-                    "yt-dlp has been updated successfully!\n"
-                    "The new version will be used for future downloads.",
-                )
-                logging.info("yt-dlp updated successfully")
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Update Failed",
-                    f"Failed to update yt-dlp:\n{result.stderr or result.stdout}",
-                )
-                logging.error(f"yt-dlp update failed: {result.stderr}")
+            # Non-modal progress dialog, Cancel stops pip
+            self.update_progress = QProgressDialog(
+                "Updating yt-dlp, please wait...", "Cancel", 0, 0, self
+            )
+            self.update_progress.setWindowTitle("Updating yt-dlp")
+            self.update_progress.setWindowModality(Qt.WindowModality.NonModal)
+            self.update_progress.setMinimumDuration(0)
+            self.update_progress.canceled.connect(self.cancel_yt_dlp_update)
+
+            # Give up if pip hasn't finished after a minute
+            self.update_watchdog = QTimer(self)
+            self.update_watchdog.setSingleShot(True)
+            self.update_watchdog.timeout.connect(self.on_update_timeout)
+        elif self.update_process.state() != QProcess.ProcessState.NotRunning:
+            return  # Already updating
+
+        self.update_output = []
+        self.update_timed_out = False
+        self.update_cancelled = False
+
+        # Keep transcriptions from starting while pip writes to the console
+        self.run_btn.setEnabled(False)
+        self.update_progress.show()
+        self._flush_console()
+        self._append_text_to_console("Updating yt-dlp...\n")
+        self.update_process.start(
+            sys.executable, ["-m", "pip", "install", "--upgrade", "yt-dlp"]
+        )
+        self.update_watchdog.start(60000)
+
+    def handle_update_output(self):
+        data = (
+            self.update_process.readAllStandardOutput()
+            .data()
+            .decode("utf-8", errors="ignore")
+        )
+        self.update_output.append(data)
+        self._queue_console_output(data)
+
+    def cancel_yt_dlp_update(self):
+        if self.update_process.state() != QProcess.ProcessState.NotRunning:
+            self.update_cancelled = True
+            self.update_process.kill()
+
+    def on_update_timeout(self):
+        self.update_timed_out = True
+        self.update_process.kill()
+
+    def on_update_finished(self, exit_code, exit_status):
+        self.update_watchdog.stop()
+        self.update_progress.close()
+        self._flush_console()
+        self.run_btn.setEnabled(True)
+        output = "".join(self.update_output).strip()
 
-        except subprocess.TimeoutExpired:
-            progress.close()
+        if self.update_timed_out:
             QMessageBox.warning(
                 self,
                 "Update Timeout",
                 "yt-dlp update timed out. Please try again later.",
             )
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
+        elif self.update_cancelled:
+            logging.info("yt-dlp update cancelled by user")
+        elif exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+            QMessageBox.information(
+                self,
+                "Update Successful",
+                "yt-dlp has been updated successfully!\n"
+                "The new version will be used for future downloads.",
+            )
+            logging.info("yt-dlp updated successfully")
+        else:
+            QMessageBox.warning(
                 self,
-                "Update Error",
-                f"An error occurred while updating yt-dlp:\n{str(e)}",
+                "Update Failed",
+                f"Failed to update yt-dlp:\n{output[-2000:]}",
             )
-            logging.error(f"yt-dlp update error: {e}")
+            logging.error(f"yt-dlp update failed: {output}")
+
+    def on_update_error(self, error):
+        # Every other error is followed by finished(), which reports it
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        self.update_watchdog.stop()
+        self.update_progress.close()
+        self.run_btn.setEnabled(True)
+        QMessageBox.critical(
+            self,
+            "Update Error",
+            f"An error occurred while updating yt-dlp:\n{self.update_process.errorString()}",
+        )
+        logging.error(f"yt-dlp update error: {self.update_process.errorString()}")
 
     def setup_realtime_saving(self):
         """Connect UI elements to save settings in real-time"""
+        # Settings key persisted by each combo box and spin box, so a change
+        # only updates its own key
+        self.combo_setting_keys = {
+            self.model_combo: "model",
+            self.task_combo: "task",
+            self.language_combo: "language",
+            self.compute_combo: "compute_type",
+            self.device_combo: "device",
+            self.vad_method: "vad_method",
+        }
+        self.spinbox_setting_keys = {
+            self.temperature: "temperature",
+            self.beam_size: "beam_size",
+            self.best_of: "best_of",
+            self.patience: "patience",
+            self.vad_threshold: "vad_threshold",
+            self.vad_min_speech: "vad_min_speech",
+            self.ff_tempo: "ff_tempo",
+        }
+
         # Connect combo boxes
-        self.model_combo.currentTextChanged.connect(self.save_combo_setting)
-        self.task_combo.currentTextChanged.connect(self.save_combo_setting)
-        self.language_combo.currentTextChanged.connect(self.save_combo_setting)
-        self.compute_combo.currentTextChanged.connect(self.save_combo_setting)
-        self.device_combo.currentTextChanged.connect(self.save_combo_setting)
-        self.vad_method.currentTextChanged.connect(self.save_combo_setting)
+        for combo in self.combo_setting_keys:
+            combo.currentTextChanged.connect(self.save_combo_setting)
 
         # Connect spin boxes
-        self.temperature.valueChanged.connect(self.save_spinbox_setting)
-        self.beam_size.valueChanged.connect(self.save_spinbox_setting)
-        self.best_of.valueChanged.connect(self.save_spinbox_setting)
-        self.patience.valueChanged.connect(self.save_spinbox_setting)
-        self.vad_threshold.valueChanged.connect(self.save_spinbox_setting)
-        self.vad_min_speech.valueChanged.connect(self.save_spinbox_setting)
-        self.ff_tempo.valueChanged.connect(self.save_spinbox_setting)
+        for spinbox in self.spinbox_setting_keys:
+            spinbox.valueChanged.connect(self.save_spinbox_setting)
 
         # Connect text fields
         self.output_dir.textChanged.connect(self.save_text_setting)
         self.initial_prompt.textChanged.connect(self.save_text_setting)
 
         # Connect checkboxes (they'll save when toggled)
-        for checkbox in self.findChildren(QCheckBox):
-            if checkbox.objectName():
-                checkbox.toggled.connect(self.save_checkbox_setting)
+        for checkbox in self._named_checkboxes.values():
+            checkbox.toggled.connect(self.save_checkbox_setting)
 
         # Connect output format checkboxes
         for fmt, checkbox in self.output_format_checkboxes.items():
@@ -1078,55 +1654,53 @@ class WhisperGUI(QMainWindow):
         # Connect splitter movement
         self.main_splitter.splitterMoved.connect(self.save_splitter_setting)
 
-    def save_combo_setting(self):
-        """Save combo box settings immediately"""
-        self.settings["model"] = self.model_combo.currentText()
-        self.settings["task"] = self.task_combo.currentText()
-        self.settings["language"] = self.language_combo.currentText()
-        self.settings["compute_type"] = self.compute_combo.currentText()
-        self.settings["device"] = self.device_combo.currentText()
-        self.settings["vad_method"] = self.vad_method.currentText()
-        self.save_settings_to_file()
+    def save_combo_setting(self, text):
+        """Save the changed combo box setting"""
+        key = self.combo_setting_keys.get(self.sender())
+        if key is None or self.settings.get(key) == text:
+            return
+        self.settings[key] = text
+        self.schedule_settings_save()
 
-    def save_spinbox_setting(self):
-        """Save spinbox settings immediately"""
-        self.settings["temperature"] = self.temperature.value()
-        self.settings["beam_size"] = self.beam_size.value()
-        self.settings["best_of"] = self.best_of.value()
-        self.settings["patience"] = self.patience.value()
-        self.settings["vad_threshold"] = self.vad_threshold.value()
-        self.settings["vad_min_speech"] = self.vad_min_speech.value()
-        self.settings["ff_tempo"] = self.ff_tempo.value()
-        self.save_settings_to_file()
+    def save_spinbox_setting(self, value):
+        """Save the changed spinbox setting"""
+        key = self.spinbox_setting_keys.get(self.sender())
+        if key is None or self.settings.get(key) == value:
+            return
+        self.settings[key] = value
+        self.schedule_settings_save()
 
     def save_text_setting(self):
         """Save text field settings immediately"""
         self.settings["output_dir"] = self.output_dir.text()
         self.settings["initial_prompt"] = self.initial_prompt.toPlainText()
-        self.save_settings_to_file()
-
-    def save_checkbox_setting(self):
-        """Save checkbox settings immediately"""
-        checkbox_settings = {
-            cb.objectName(): cb.isChecked()
-            for cb in self.findChildren(QCheckBox)
-            if cb.objectName()
-        }
-        self.settings["checkboxes"] = checkbox_settings
-        self.save_settings_to_file()
+        self.schedule_settings_save()
+
+    def save_checkbox_setting(self, checked):
+        """Save the toggled checkbox setting"""
+        checkbox = self.sender()
+        name = checkbox.objectName() if checkbox else ""
+        checkbox_settings = self.settings.setdefault("checkboxes", {})
+        if not name or checkbox_settings.get(name) == checked:
+            return
+        checkbox_settings[name] = checked
+        self.schedule_settings_save()
 
     def save_output_format_setting(self):
         """Save output format settings immediately"""
         output_formats = [
             fmt for fmt, cb in self.output_format_checkboxes.items() if cb.isChecked()
         ]
+        if self.settings.get("output_formats") == output_formats:
+            return
         self.settings["output_formats"] = output_formats
-        self.save_settings_to_file()
+        self.schedule_settings_save()
 
     def save_splitter_setting(self):
-        """Save splitter position immediately"""
+        """Remember the splitter position for the next settings write"""
+        # A drag emits splitterMoved for every step, so this doesn't trigger a
+        # write of its own; the next save or closing the window persists it
         self.settings["splitter_sizes"] = self.main_splitter.sizes()
-        self.save_settings_to_file()
 
     def browse_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1150,81 +1724,83 @@ class WhisperGUI(QMainWindow):
         os.makedirs(dir_path, exist_ok=True)
         return dir_path
 
-    def build_command(self, input_file):
+    def setup_command_options(self):
+        """Map the option widgets to the command-line arguments they produce"""
+
+        def if_vad(get_value):
+            return lambda: get_value() if self.vad_filter.isChecked() else None
+
+        # (option, value getter, value that leaves the option out)
+        self._cmd_option_specs = (
+            ("-m", self.model_combo.currentText, None),
+            ("--task", self.task_combo.currentText, None),
+            ("-l", self.language_combo.currentText, "auto"),
+            ("--compute_type", self.compute_combo.currentText, None),
+            ("--device", self.device_combo.currentText, None),
+            ("--temperature", lambda: str(self.temperature.value()), "0.0"),
+            ("--beam_size", lambda: str(self.beam_size.value()), "5"),
+            ("--best_of", lambda: str(self.best_of.value()), "5"),
+            ("--patience", lambda: str(self.patience.value()), "1.0"),
+            ("--initial_prompt", self.initial_prompt.toPlainText, ""),
+            ("--output_dir", self.get_output_dir, None),
+            ("--vad_method", if_vad(self.vad_method.currentText), None),
+            (
+                "--vad_threshold",
+                if_vad(lambda: str(self.vad_threshold.value())),
+                None,
+            ),
+            (
+                "--vad_min_speech_duration_ms",
+                if_vad(lambda: str(self.vad_min_speech.value())),
+                None,
+            ),
+            (
+                "--ff_tempo",
+                lambda: (
+                    str(self.ff_tempo.value())
+                    if self.tempo_checkbox.isChecked()
+                    else None
+                ),
+                None,
+            ),
+        )
+        self._cmd_flag_checkboxes = (
+            ("--word_timestamps", self.word_timestamps),
+            ("--without_timestamps", self.without_timestamps),
+            ("--verbose", self.verbose),
+            ("--print_progress", self.print_progress),
+            ("--highlight_words", self.highlight_words),
+            ("--vad_filter", self.vad_filter),
+            ("--ff_mp3", self.ff_mp3),
+            ("--ff_loudnorm", self.ff_loudnorm),
+            ("--ff_speechnorm", self.ff_speechnorm),
+        )
+
+    def check_executable(self):
+        """Return an error message if the core executable can't be run, else None"""
         if not self.executable_path or not os.path.exists(self.executable_path):
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Core executable not found at: {self.executable_path}. Please restart the application to run the setup.",
-            )
-            return None
+            return f"Core executable not found at: {self.executable_path}. Please restart the application to run the setup."
 
         # Check if executable has proper permissions
         if not os.access(self.executable_path, os.X_OK):
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Executable at {self.executable_path} does not have execute permissions.",
-            )
+            return f"Executable at {self.executable_path} does not have execute permissions."
+        return None
+
+    def build_command(self, input_file):
+        if self._executable_error:
+            QMessageBox.critical(self, "Error", self._executable_error)
             return None
         if not input_file or not os.path.exists(input_file):
             QMessageBox.warning(self, "Warning", f"Input file not found: {input_file}")
             return None
 
         cmd = [self.executable_path, input_file]
-        options = {
-            "-m": self.model_combo.currentText(),
-            "--task": self.task_combo.currentText(),
-            "-l": self.language_combo.currentText()
-            if self.language_combo.currentText() != "auto"
-            else None,
-            "--compute_type": self.compute_combo.currentText(),
-            "--device": self.device_combo.currentText(),
-            "--temperature": str(self.temperature.value())
-            if self.temperature.value() > 0
-            else None,
-            "--beam_size": str(self.beam_size.value())
-            if self.beam_size.value() != 5
-            else None,
-            "--best_of": str(self.best_of.value())
-            if self.best_of.value() != 5
-            else None,
-            "--patience": str(self.patience.value())
-            if self.patience.value() != 1.0
-            else None,
-            "--initial_prompt": self.initial_prompt.toPlainText()
-            if self.initial_prompt.toPlainText()
-            else None,
-            "--output_dir": self.get_output_dir(),
-            "--vad_method": self.vad_method.currentText()
-            if self.vad_filter.isChecked()
-            else None,
-            "--vad_threshold": str(self.vad_threshold.value())
-            if self.vad_filter.isChecked()
-            else None,
-            "--vad_min_speech_duration_ms": str(self.vad_min_speech.value())
-            if self.vad_filter.isChecked()
-            else None,
-            "--ff_tempo": str(self.ff_tempo.value())
-            if self.tempo_checkbox.isChecked()
-            else None,
-        }
-        for option, value in options.items():
-            if value is not None:
+        for option, get_value, omit_value in self._cmd_option_specs:
+            value = get_value()
+            if value is not None and value != omit_value:
                 cmd.extend([option, value])
 
-        checkboxes = {
-            "--word_timestamps": self.word_timestamps,
-            "--without_timestamps": self.without_timestamps,
-            "--verbose": self.verbose,
-            "--print_progress": self.print_progress,
-            "--highlight_words": self.highlight_words,
-            "--vad_filter": self.vad_filter,
-            "--ff_mp3": self.ff_mp3,
-            "--ff_loudnorm": self.ff_loudnorm,
-            "--ff_speechnorm": self.ff_speechnorm,
-        }
-        for option, checkbox in checkboxes.items():
+        for option, checkbox in self._cmd_flag_checkboxes:
             if checkbox.isChecked():
                 cmd.append(option)
 
@@ -1270,14 +1846,11 @@ class WhisperGUI(QMainWindow):
 
         self.output_text.clear()
 
-        quoted_command_parts = []
-        for arg in command:
-            if " " in arg or '"' in arg or "'" in arg:
-                processed_arg = arg.replace('"', '\\"')
-                quoted_command_parts.append(f'"{processed_arg}"')
-            else:
-                quoted_command_parts.append(arg)
-        display_command = " ".join(quoted_command_parts)
+        # Quote the command the way the user's shell would expect
+        if sys.platform == "win32":
+            display_command = subprocess.list2cmdline(command)
+        else:
+            display_command = shlex.join(command)
 
         logging.info(f"Starting QProcess with command: {command}")
         self._append_text_to_console(
@@ -1298,6 +1871,7 @@ class WhisperGUI(QMainWindow):
 
     def stop_processing(self):
         self.stop_requested = True
+        self._flush_console()
         if self.downloader and self.downloader.isRunning():
             self._append_text_to_console("\nRequesting download cancellation...\n")
             self.downloader.stop()
@@ -1315,73 +1889,89 @@ class WhisperGUI(QMainWindow):
             self.process.readAllStandardOutput().data().decode("utf-8", errors="ignore")
         )
         self.check_for_transcription_success(data)
-        self._append_text_to_console(data)
+        self._queue_console_output(data)
 
     def handle_stderr(self):
         data = (
             self.process.readAllStandardError().data().decode("utf-8", errors="ignore")
         )
         self.check_for_transcription_success(data)
-        self._append_text_to_console(data)
+        self._queue_console_output(data)
+
+    def _queue_console_output(self, text_chunk):
+        """Collect process output and write it to the console in batches"""
+        self._pending_output.append(text_chunk)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_console(self):
+        self._flush_timer.stop()
+        if self._pending_output:
+            text = "".join(self._pending_output)
+            self._pending_output.clear()
+            self._append_text_to_console(text)
 
     def _append_text_to_console(self, text_chunk, is_html=False):
-        cursor = self.output_text.textCursor()
+        # Hold off repainting until the whole chunk is in the document
+        self.output_text.setUpdatesEnabled(False)
+        try:
+            self._insert_console_text(text_chunk, is_html)
+        finally:
+            self.output_text.setUpdatesEnabled(True)
+            self.output_text.ensureCursorVisible()
+
+    def _insert_console_text(self, text_chunk, is_html):
+        cursor = self._append_cursor
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
         if is_html:
             cursor.insertHtml(text_chunk)
             self.last_line_was_overwrite = False
-            self.output_text.ensureCursorVisible()
             return
 
         self.output_buffer += text_chunk.replace("\r\n", "\n")
+        tokens = CONSOLE_LINE_BREAK_RE.split(self.output_buffer)
+        # The last token has no line ending yet, keep it for the next chunk
+        self.output_buffer = tokens.pop()
 
-        while "\n" in self.output_buffer or "\r" in self.output_buffer:
-            r_pos = self.output_buffer.find("\r")
-            n_pos = self.output_buffer.find("\n")
-
-            if r_pos != -1 and (r_pos < n_pos or n_pos == -1):
-                break_pos = r_pos
-                line_ending = "\r"
-            else:
-                break_pos = n_pos
-                line_ending = "\n"
-
-            line = self.output_buffer[:break_pos]
-            self.output_buffer = self.output_buffer[break_pos + 1 :]
-
+        pending = []
+        for line, line_ending in zip(tokens[::2], tokens[1::2]):
             if self.last_line_was_overwrite:
-                cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-                cursor.movePosition(
-                    QTextCursor.MoveOperation.EndOfBlock,
-                    QTextCursor.MoveMode.KeepAnchor,
-                )
-                cursor.removeSelectedText()
-                cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock)
-
-            cursor.insertText(line)
+                # A line ended by "\r" is replaced by the one that follows it.
+                # If it's still pending it never needs to be drawn, otherwise
+                # clear it from the document.
+                if pending:
+                    pending.pop()
+                if not pending:
+                    cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
+                    cursor.movePosition(
+                        QTextCursor.MoveOperation.EndOfBlock,
+                        QTextCursor.MoveMode.KeepAnchor,
+                    )
+                    cursor.removeSelectedText()
 
             if line_ending == "\n":
-                cursor.insertText(
-                    "\n"
-                )  # Explicitly add newline to ensure proper line breaks
+                pending.append(line + "\n")
                 self.last_line_was_overwrite = False
             else:  # line_ending == '\r'
+                pending.append(line)
                 self.last_line_was_overwrite = True
 
-        self.output_text.ensureCursorVisible()
+        if pending:
+            cursor.insertText("".join(pending))
 
     def on_finished(self, exit_code, exit_status):
         logging.info(
             f"QProcess finished. Exit Code: {exit_code}, Exit Status: {exit_status}"
         )
 
+        self._flush_console()
         if self.output_buffer:
-            self._append_text_to_console(self.output_buffer + "\n")
-            self.output_buffer = ""
+            # Terminate the buffered partial line so it gets written out
+            self._append_text_to_console("\n")
 
         if self.last_line_was_overwrite:
-            self.output_text.append("")
+            self.output_text.appendPlainText("")
 
         self._append_text_to_console("=" * 50 + "\n")
         if self.stop_requested:
@@ -1404,6 +1994,9 @@ class WhisperGUI(QMainWindow):
         self.stop_requested = False
 
     def on_process_error(self, error):
+        # Write out queued output first so any error banner follows it
+        self._flush_console()
+
         # Don't show crash errors if we already detected successful transcription
         if (
             error == QProcess.ProcessError.Crashed
@@ -1414,6 +2007,10 @@ class WhisperGUI(QMainWindow):
             )
             return
 
+        if error == QProcess.ProcessError.FailedToStart:
+            # The executable may have been removed since startup, check again
+            self._executable_error = self.check_executable()
+
         error_map = {
             QProcess.ProcessError.FailedToStart: "Failed to start: The process failed to start. Check if the executable exists, has the correct permissions, and if all required libraries are available.",
             QProcess.ProcessError.Crashed: "Crashed: The process crashed some time after starting.",
@@ -1485,33 +2082,37 @@ class WhisperGUI(QMainWindow):
             self.stop_processing()
             self.process.waitForFinished(1000)
 
+        # Stop the writer thread first so the final save below is written
+        # synchronously, which also covers any pending debounced save
+        self.stop_settings_writer()
         if hasattr(self, "main_splitter"):
             self.save_settings()
+        elif self._settings_save_timer.isActive():
+            self.save_settings_to_file()
 
         super().closeEvent(event)
 
+    def schedule_settings_save(self):
+        """Save settings once the UI has been idle for a moment"""
+        self._settings_save_timer.start()
+
     def save_settings_to_file(self):
-        """Save current settings dictionary to file atomically"""
-        try:
-            # Write to temporary file first for atomic operation
-            temp_file = self.settings_file + ".tmp"
-            with open(temp_file, "w") as f:
-                json.dump(self.settings, f, indent=4)
-
-            # Atomic rename operation
-            if os.path.exists(temp_file):
-                if os.path.exists(self.settings_file):
-                    os.remove(self.settings_file)
-                os.rename(temp_file, self.settings_file)
-        except Exception as e:
-            logging.error(f"Failed to save settings: {e}")
-            # Clean up temp file if it exists
-            temp_file = self.settings_file + ".tmp"
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+        """Hand a snapshot of the settings to the writer thread"""
+        self._settings_save_timer.stop()
+        snapshot = copy.deepcopy(self.settings)
+        if self._settings_writer_active:
+            self.settings_write_requested.emit(snapshot)
+        else:
+            # Before startup finished or after shutdown, write directly
+            self._settings_writer.write(snapshot)
+
+    def stop_settings_writer(self):
+        # Anything saved from here on is written directly, even if the thread
+        # is still busy, since its event loop won't pick up new requests
+        self._settings_writer_active = False
+        self._settings_writer_thread.quit()
+        if not self._settings_writer_thread.wait(2000):
+            logging.warning("Settings writer thread did not stop within 2 seconds")
 
     def save_settings(self):
         """Collect all current settings and save to file"""
@@ -1536,9 +2137,7 @@ class WhisperGUI(QMainWindow):
         self.settings["ff_tempo"] = self.ff_tempo.value()
 
         checkbox_settings = {
-            cb.objectName(): cb.isChecked()
-            for cb in self.findChildren(QCheckBox)
-            if cb.objectName()
+            name: cb.isChecked() for name, cb in self._named_checkboxes.items()
         }
         self.settings["checkboxes"] = checkbox_settings
 
@@ -1551,17 +2150,16 @@ class WhisperGUI(QMainWindow):
 
     def load_settings(self):
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, "r") as f:
-                    self.settings = json.load(f)
-            else:
-                self.settings = {}
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            self.settings = read_settings_file(self.settings_file)
+        except FileNotFoundError:
+            self.settings = {}
+        except json.JSONDecodeError as e:
             logging.warning(f"Could not load settings file: {e}. Using defaults.")
             self.settings = {}
 
+        theme_saved = "theme" in self.settings
         # Get system theme if no theme is saved
-        if "theme" not in self.settings:
+        if not theme_saved:
             system_theme = self.get_system_theme()
             theme = system_theme
         else:
@@ -1577,15 +2175,10 @@ class WhisperGUI(QMainWindow):
 
         if geometry_hex := self.settings.get("geometry"):
             try:
-                # Validate hex string before using it
-                if isinstance(geometry_hex, str) and all(
-                    c in "0123456789abcdefABCDEF" for c in geometry_hex
-                ):
-                    self.restoreGeometry(
-                        QByteArray.fromHex(bytes(geometry_hex, "utf-8"))
-                    )
-                else:
-                    logging.warning("Invalid geometry data in settings")
+                # bytes.fromhex validates and decodes the string in one pass
+                self.restoreGeometry(QByteArray(bytes.fromhex(geometry_hex)))
+            except (TypeError, ValueError):
+                logging.warning("Invalid geometry data in settings")
             except Exception as e:
                 logging.warning(f"Failed to restore window geometry: {e}")
         if splitter_sizes := self.settings.get("splitter_sizes"):
@@ -1609,20 +2202,20 @@ class WhisperGUI(QMainWindow):
         self.vad_min_speech.setValue(self.settings.get("vad_min_speech", 250))
         self.ff_tempo.setValue(self.settings.get("ff_tempo", 1.0))
 
-        all_checkboxes = {
-            cb.objectName(): cb
-            for cb in self.findChildren(QCheckBox)
-            if cb.objectName()
-        }
         checkbox_settings = self.settings.get("checkboxes", {})
         for name, checked in checkbox_settings.items():
-            if name in all_checkboxes:
-                all_checkboxes[name].setChecked(checked)
+            if name in self._named_checkboxes:
+                self._named_checkboxes[name].setChecked(checked)
 
         output_formats = self.settings.get("output_formats", ["srt"])
         for fmt, cb in self.output_format_checkboxes.items():
             cb.setChecked(fmt in output_formats)
 
+        # apply_theme queued a save, but the settings just came from the file;
+        # only a newly detected theme needs writing back
+        if theme_saved:
+            self._settings_save_timer.stop()
+
 
 def main():
     if hasattr(Qt.ApplicationAttribute, "AA_EnableHighDpiScaling"):